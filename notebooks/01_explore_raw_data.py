@@ -7,9 +7,14 @@ app = marimo.App(width="medium")
 @app.cell
 def _():
     # Imports
+    import functools
+    import os
     import sys
+    import tempfile
     from pathlib import Path
+    import orjson
     import polars as pl
+    import pyarrow.parquet as pq
     import marimo as mo
 
     # Get project root (parent of notebooks directory)
@@ -20,7 +25,19 @@ def _():
     from ingestion import download_data
 
     mo.md("# Data Exploration")
-    return Path, download_data, get_data_paths, load_config, mo, pl
+    return (
+        Path,
+        download_data,
+        functools,
+        get_data_paths,
+        load_config,
+        mo,
+        orjson,
+        os,
+        pl,
+        pq,
+        tempfile,
+    )
 
 
 @app.cell
@@ -73,55 +90,173 @@ def _(mo):
 
 
 @app.cell
-def _(DATA_PATH, SAMPLE_SIZE, pl):
-    files = {}
+def _(functools, pl, pq):
+    @functools.lru_cache(maxsize=32)
+    def summarize_parquet(path_str, mtime_ns, sample_size):
+        """
+        Compute row count, preview and completion stats of a Parquet file.
+
+        Row count and null counts are read from the Parquet footer statistics
+        (exact, for the whole file, without decoding any data page). Only the
+        columns without null count statistics are analyzed on a sample of
+        sample_size rows.
+
+        Results are cached so that re-running the exploration cell does not
+        re-read the files: mtime_ns is only part of the cache key, so that a
+        modified file is summarized again.
+        """
+        metadata = pq.ParquetFile(path_str).metadata
+
+        # Sum null counts of each column over all row groups
+        exact_null_counts = {}
+        missing_stats = set()
+        for rg in range(metadata.num_row_groups):
+            row_group = metadata.row_group(rg)
+            for c in range(row_group.num_columns):
+                column = row_group.column(c)
+                stats = column.statistics
+                if stats is None or not stats.has_null_count:
+                    missing_stats.add(column.path_in_schema)
+                else:
+                    exact_null_counts[column.path_in_schema] = (
+                        exact_null_counts.get(column.path_in_schema, 0)
+                        + stats.null_count
+                    )
+        for col in missing_stats:
+            exact_null_counts.pop(col, None)
+
+        # Preview, and sample of the columns without statistics, collected in
+        # parallel in a single call (the head slices are pushed down to the
+        # Parquet reader, which stops after the first row groups)
+        lazy_df = pl.scan_parquet(path_str)
+        sampled_columns = [
+            col
+            for col in metadata.schema.to_arrow_schema().names
+            if col not in exact_null_counts
+        ]
+        plans = [lazy_df.head(10)]
+        if sampled_columns:
+            plans.append(lazy_df.select(sampled_columns).head(sample_size))
+        preview, *samples = pl.collect_all(plans)
+
+        if samples:
+            df_sample = samples[0]
+            sample_null_counts = df_sample.null_count().row(0, named=True)
+            sample_rows = max(df_sample.height, 1)
+        else:
+            sample_null_counts = {}
+            sample_rows = 1
+        total_rows = max(metadata.num_rows, 1)
+
+        completion_stats = pl.DataFrame(
+            {
+                "column": preview.columns,
+                "type": [str(dtype) for dtype in preview.dtypes],
+                "null_count": [
+                    exact_null_counts.get(col, sample_null_counts.get(col))
+                    for col in preview.columns
+                ],
+                "exact": [col in exact_null_counts for col in preview.columns],
+            }
+        ).select(
+            "column",
+            "type",
+            completion_pct=(
+                100
+                - pl.col("null_count")
+                / pl.when(pl.col("exact")).then(total_rows).otherwise(sample_rows)
+                * 100
+            ).round(2),
+            null_count=pl.col("null_count"),
+            exact=pl.col("exact"),
+        )
+
+        return {
+            "total_rows": metadata.num_rows,
+            "preview": preview,
+            "completion_stats": completion_stats,
+        }
+    return (summarize_parquet,)
+
+
+@app.cell
+def _(DATA_PATH, Path, SAMPLE_SIZE, orjson, os, pl, summarize_parquet, tempfile):
+    parquet_files = list(DATA_PATH.glob("*.parquet"))
+
+    # Store lazy references
+    files = {file.name: pl.scan_parquet(file) for file in parquet_files}
+
+    # Stats persisted between sessions, keyed on file path, size, mtime and
+    # sample size (an updated file or sample size is analyzed again)
+    stats_cache_path = Path("logs") / ".file_stats_cache.json"
+    try:
+        stats_cache = orjson.loads(stats_cache_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        # Missing or corrupt cache: everything is analyzed again
+        stats_cache = {}
+    updated_stats_cache = {}
+
     file_stats = {}
-    for file in list(DATA_PATH.glob("*.parquet")):
+    for file in parquet_files:
         print(f"\n{'='*80}")
         print(file)
 
-        # Store lazy reference
-        lazy_df = pl.scan_parquet(file)
-        files[file.name] = lazy_df
+        file_info = file.stat()
+        cache_key = (
+            f"{file}:{file_info.st_size}:{file_info.st_mtime_ns}:{SAMPLE_SIZE}"
+        )
+        cached_stats = stats_cache.get(cache_key)
+        if cached_stats is None:
+            # Cached across cell re-runs as long as the file is unchanged
+            summary = summarize_parquet(str(file), file_info.st_mtime_ns, SAMPLE_SIZE)
+            total_rows = summary["total_rows"]
+            preview = summary["preview"]
+            completion_stats = summary["completion_stats"]
+            cached_stats = {
+                "total_rows": total_rows,
+                "completion_stats": completion_stats.to_dict(as_series=False),
+            }
+        else:
+            total_rows = cached_stats["total_rows"]
+            preview = files[file.name].head(10).collect()
+            completion_stats = pl.DataFrame(cached_stats["completion_stats"])
+        updated_stats_cache[cache_key] = cached_stats
 
         # Get total row count
-        total_rows = lazy_df.select(pl.len()).collect().item()
         print(f"Total rows: {total_rows:,}")
     
         # Show sample data
         print("\nSample data (first 10 rows):")
-        print(pl.read_parquet(file, n_rows=10))
-
-        # Read sample for completion analysis
-        df_sample = pl.read_parquet(file, n_rows=SAMPLE_SIZE)
-    
-        print(f"\nCompletion rate (based on {SAMPLE_SIZE:,} sample size rows)")
-        print(f"\n{'Column':<50} {'Type':<15} {'Completion %':<15}")
-        print('-'*80)
-    
-        # Calculate completion % for each column
-        completion_stats = []
-        for col in df_sample.columns:
-            null_count = df_sample[col].null_count()
-            completion_pct = ((SAMPLE_SIZE - null_count) / SAMPLE_SIZE) * 100
-            dtype = str(df_sample[col].dtype)
-        
-            print(f"{col:<50} {dtype:<15} {completion_pct:>6.2f}%")
-        
-            completion_stats.append({
-                'column': col,
-                'type': dtype,
-                'completion_pct': completion_pct,
-                'null_count': null_count
-            })
+        print(preview)
+
+        print(
+            "\nCompletion rate (exact from Parquet statistics, or based on "
+            f"{SAMPLE_SIZE:,} sample size rows when exact is false)"
+        )
+        with pl.Config(tbl_rows=-1):
+            print(completion_stats)
     
         # Store stats
         file_stats[file.name] = {
             'total_rows': total_rows,
             'sample_size': SAMPLE_SIZE,
-            'num_columns': len(df_sample.columns),
+            'num_columns': completion_stats.height,
             'completion_stats': completion_stats
         }
+
+    # Only keep entries of current files
+    if updated_stats_cache != stats_cache:
+        stats_cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so that an interrupted or concurrent run never
+        # leaves a truncated cache behind
+        with tempfile.NamedTemporaryFile(
+            dir=stats_cache_path.parent,
+            prefix=stats_cache_path.name + ".",
+            suffix=".tmp",
+            delete=False,
+        ) as stats_cache_tmp:
+            stats_cache_tmp.write(orjson.dumps(updated_stats_cache))
+        os.replace(stats_cache_tmp.name, stats_cache_path)
     return
 
 
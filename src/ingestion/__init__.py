@@ -1,5 +1,6 @@
 """Data ingestion module."""
 
 from .download_data import download_file, download_insee_files
+from .remote_parquet import open_remote_parquet
 
-__all__ = ["download_file", "download_insee_files"]
+__all__ = ["download_file", "download_insee_files", "open_remote_parquet"]
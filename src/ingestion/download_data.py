@@ -1,57 +1,672 @@
 """Functions for data ingestion process."""
 
+import errno
+import json
 import logging
+import os
+import socket
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3 import exceptions as urllib3_exceptions
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 
 from utils.logger import setup_logger
 
 # Setup logger for this module
 logger = setup_logger(__name__)
 
+# Number of hosts whose connection pools are kept
+_POOL_CONNECTIONS = 8
+
+# Maximum number of pooled connections per host, shared by all downloads
+# (concurrent files x parallel ranges per file)
+_POOL_MAXSIZE = 32
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTP adapter tuning the sockets of pooled connections."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        # Keep urllib3 defaults (TCP_NODELAY: no Nagle delay on small writes
+        # such as request headers) and enable TCP keep-alive, so that
+        # connections idle between two files are not silently dropped
+        kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _create_session() -> requests.Session:
+    """
+    Create the HTTP session shared by all downloads.
+
+    Reusing one session keeps TCP/TLS connections alive between requests,
+    so range requests and successive files to the same host skip the
+    connection setup and TLS handshake. Requests failing with a transient
+    gateway error are retried with exponential backoff.
+
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+    adapter = _KeepAliveAdapter(
+        pool_connections=_POOL_CONNECTIONS,
+        pool_maxsize=_POOL_MAXSIZE,
+        max_retries=retries,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _create_session()
+
+
+def _get_remote_file_info(
+    session: requests.Session, url: str
+) -> Tuple[int, bool, Optional[str]]:
+    """
+    Fetch size, byte-range support and validator of a remote file (HEAD).
+
+    Args:
+        session: HTTP session used to issue the request
+        url: URL of the remote file
+
+    Returns:
+        Tuple (size in bytes, whether HTTP Range requests are supported,
+        validator). Size is 0 when the server does not report it (or does not
+        support HEAD requests). The validator is the strong ETag, or else the
+        Last-Modified date, identifying the current version of the file (None
+        if the server sends neither).
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails or the
+            server answers with an error status (e.g. missing file)
+    """
+    response = session.head(url, allow_redirects=True, timeout=10)
+    if response.status_code == 405:
+        # HEAD not allowed: nothing known until the GET request
+        logger.debug("HEAD request not allowed for %s", url)
+        return 0, False, None
+    response.raise_for_status()
+
+    total_size = int(response.headers.get("content-length", 0))
+    accepts_ranges = response.headers.get("accept-ranges", "").lower() == "bytes"
+
+    # If-Range only accepts strong ETags
+    etag = response.headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        validator = etag
+    else:
+        validator = response.headers.get("last-modified")
+    return total_size, accepts_ranges, validator
+
+
+def _load_resume_state(
+    state_path: Path, part_path: Path, total_size: int, validator: Optional[str]
+) -> Optional[List[Tuple[int, int]]]:
+    """
+    Load the byte ranges left to download by an interrupted download.
+
+    Args:
+        state_path: Resume state file written by the interrupted download
+        part_path: Partial file of the interrupted download
+        total_size: Current size of the remote file (in bytes)
+        validator: Current validator (ETag/Last-Modified) of the remote file
+
+    Returns:
+        List of (start, end) ranges still to download, or None if the partial
+        file cannot be resumed (missing, or the remote file changed since)
+    """
+    if validator is None or not part_path.exists() or not state_path.exists():
+        return None
+
+    try:
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    if (
+        state.get("size") != total_size
+        or state.get("validator") != validator
+        or part_path.stat().st_size != total_size
+    ):
+        return None
+
+    return [(start, end) for start, end in state["ranges"]]
+
+
+def _save_resume_state(
+    state_path: Path,
+    total_size: int,
+    validator: str,
+    ranges: List[Tuple[int, int]],
+) -> None:
+    """
+    Record the byte ranges left to download, so that a later call can resume.
+
+    Args:
+        state_path: Resume state file to write
+        total_size: Size of the remote file (in bytes)
+        validator: Validator (ETag/Last-Modified) of the downloaded version
+        ranges: List of (start, end) ranges still to download
+    """
+    state = {"size": total_size, "validator": validator, "ranges": ranges}
+    state_path.write_text(json.dumps(state), encoding="utf-8")
+
+
+def _read_chunk(raw, chunk_size: int) -> bytes:
+    """
+    Read the next chunk from a raw (urllib3) response stream.
+
+    urllib3 errors are re-raised as the requests exceptions iter_content would
+    have raised, so that callers only have to handle requests exceptions.
+
+    Args:
+        raw: Underlying urllib3 response (response.raw)
+        chunk_size: Maximum number of bytes to read
+
+    Returns:
+        Bytes read (empty at the end of the stream)
+    """
+    try:
+        return raw.read(chunk_size)
+    except urllib3_exceptions.ReadTimeoutError as e:
+        raise requests.exceptions.ConnectionError(e)
+    except urllib3_exceptions.SSLError as e:
+        raise requests.exceptions.SSLError(e)
+    except urllib3_exceptions.DecodeError as e:
+        raise requests.exceptions.ContentDecodingError(e)
+    except urllib3_exceptions.HTTPError as e:
+        # Dropped connection, truncated body (ProtocolError, IncompleteRead)
+        raise requests.exceptions.ChunkedEncodingError(e)
+
+
+def _open_output(local_path: Path, truncate: bool = True) -> int:
+    """
+    Open (create or truncate) the destination file for unbuffered writes.
+
+    Args:
+        local_path: Path where the file will be stored
+        truncate: Whether to discard the existing content of the file
+
+    Returns:
+        File descriptor opened for writing
+    """
+    flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+    if truncate:
+        flags |= os.O_TRUNC
+    return os.open(local_path, flags, 0o644)
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """
+    Reserve size bytes for the destination file.
+
+    Where available, posix_fallocate lets the filesystem allocate contiguous
+    extents up-front, limiting fragmentation of multi-GB sequential writes.
+    Otherwise the file is only extended.
+
+    Args:
+        fd: File descriptor opened for writing
+        size: Final size of the file (in bytes)
+    """
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, 0, size)
+            return
+        except OSError as e:
+            # Only fall back when the filesystem does not support it: other
+            # errors (e.g. no space left on device) must stop the download
+            if e.errno not in (errno.EOPNOTSUPP, errno.ENOTSUP, errno.EINVAL):
+                raise
+    os.ftruncate(fd, size)
+
+
+def _close_output(fd: int) -> None:
+    """
+    Close the destination file, evicting its pages from the page cache.
+
+    Downloaded files are only read once, later, by the Parquet reader, so on
+    Linux the written pages are flushed and dropped from the page cache
+    rather than evicting more useful data.
+
+    Args:
+        fd: File descriptor returned by _open_output
+    """
+    try:
+        if sys.platform == "linux":
+            os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """
+    Write the whole buffer to fd, retrying on short writes.
+
+    Args:
+        fd: File descriptor opened for writing
+        data: Bytes to write
+    """
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _pwrite_all(fd: int, data: bytes, offset: int) -> None:
+    """
+    Write the whole buffer to fd at offset, retrying on short writes.
+
+    Args:
+        fd: File descriptor opened for writing
+        data: Bytes to write
+        offset: File offset of the first byte
+    """
+    view = memoryview(data)
+    while view:
+        written = os.pwrite(fd, view, offset)
+        view = view[written:]
+        offset += written
+
+
+def _pwrite_batch(fd: int, buffers: List[bytes], offset: int) -> int:
+    """
+    Write a batch of buffers contiguously at offset.
+
+    Uses a single vectored pwritev syscall where available and completes
+    any short write with pwrite.
+
+    Args:
+        fd: File descriptor opened for writing
+        buffers: Buffers to write, in order
+        offset: File offset of the first byte
+
+    Returns:
+        Number of bytes written
+    """
+    size = sum(len(buffer) for buffer in buffers)
+    written = os.pwritev(fd, buffers, offset) if hasattr(os, "pwritev") else 0
+    if written < size:
+        _pwrite_all(fd, b"".join(buffers)[written:], offset + written)
+    return size
+
+
+def _download_stream(
+    session: requests.Session,
+    url: str,
+    local_path: Path,
+    chunk_size: int,
+    pbar: tqdm,
+    progress_every: int,
+    cancel: threading.Event,
+) -> None:
+    """
+    Download a file over a single streamed GET request.
+
+    Args:
+        session: HTTP session used to issue the request
+        url: URL of the file to be downloaded
+        local_path: Path where the file will be stored
+        chunk_size: Size of chunks to download (in bytes)
+        pbar: Progress bar to update (may be disabled)
+        progress_every: Number of chunks between two progress bar refreshes
+        cancel: Event set to interrupt the download (KeyboardInterrupt is
+                raised after the current chunk)
+    """
+    with session.get(url, stream=True, timeout=30) as response:
+        response.raise_for_status()
+
+        content_length = int(response.headers.get("content-length", 0))
+        if not pbar.total:
+            pbar.total = content_length or None
+
+        # Content-Length is the size of the file unless the body is encoded
+        file_size = 0 if "content-encoding" in response.headers else content_length
+
+        # Read straight from the underlying urllib3 stream (bypasses the
+        # iter_content generator) while still decoding gzip/deflate
+        raw = response.raw
+        raw.decode_content = True
+
+        fd = _open_output(local_path)
+        written = 0
+        try:
+            if file_size:
+                _preallocate(fd, file_size)
+
+            pending = 0
+            chunks_read = 0
+            while True:
+                chunk = _read_chunk(raw, chunk_size)
+                if cancel.is_set():
+                    raise KeyboardInterrupt(f"Download of {url} cancelled")
+                if not chunk:
+                    break
+                _write_all(fd, chunk)
+                written += len(chunk)
+                pending += len(chunk)
+                chunks_read += 1
+                if chunks_read % progress_every == 0:
+                    pbar.update(pending)
+                    pending = 0
+            if pending:
+                pbar.update(pending)
+        finally:
+            # Drop the preallocated tail if less data than announced was read
+            # (including when the transfer failed midway)
+            if written < file_size:
+                os.ftruncate(fd, written)
+            _close_output(fd)
+
+
+def _download_range(
+    session: requests.Session,
+    url: str,
+    local_path: Path,
+    start: int,
+    end: int,
+    chunk_size: int,
+    pbar: tqdm,
+    abort: threading.Event,
+    cancel: threading.Event,
+    progress: Dict[int, int],
+    validator: Optional[str] = None,
+    write_batch: int = 8,
+) -> None:
+    """
+    Download the byte range [start, end] of a file into its slice of local_path.
+
+    Received chunks are written in batches of write_batch chunks, each batch
+    submitted with one syscall. The worker opens its own file descriptor, so
+    that it can outlive an aborted download without writing to a closed one.
+
+    Args:
+        session: HTTP session used to issue the request
+        url: URL of the file to be downloaded
+        local_path: Path of the (preallocated) destination file
+        start: First byte of the range (inclusive)
+        end: Last byte of the range (inclusive)
+        chunk_size: Size of chunks to download (in bytes)
+        pbar: Progress bar to update (may be disabled)
+        abort: Event set when another range failed; the download then stops
+               after the current chunk
+        cancel: Event set to interrupt the whole download; also stops the
+                download after the current chunk
+        progress: Mapping from range start to the first byte not written yet,
+                  updated after each write
+        validator: ETag/Last-Modified of the expected version of the file,
+                   sent as If-Range so that a changed file is not mixed in
+        write_batch: Number of chunks submitted per write syscall
+    """
+    if abort.is_set() or cancel.is_set():
+        return
+
+    headers = {"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"}
+    if validator:
+        headers["If-Range"] = validator
+    with session.get(url, headers=headers, stream=True, timeout=30) as response:
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise requests.exceptions.HTTPError(
+                f"Server ignored range request (status {response.status_code}), "
+                "the remote file may have changed",
+                response=response,
+            )
+
+        fd = os.open(local_path, os.O_WRONLY | getattr(os, "O_BINARY", 0))
+        try:
+            offset = start
+            batch = []
+            raw = response.raw
+            while True:
+                chunk = _read_chunk(raw, chunk_size)
+                if abort.is_set() or cancel.is_set():
+                    return
+                if chunk:
+                    batch.append(chunk)
+                if batch and (not chunk or len(batch) >= write_batch):
+                    written = _pwrite_batch(fd, batch, offset)
+                    offset += written
+                    progress[start] = offset
+                    pbar.update(written)
+                    batch = []
+                if not chunk:
+                    break
+        finally:
+            os.close(fd)
+
+    if offset != end + 1:
+        raise requests.exceptions.ChunkedEncodingError(
+            f"Incomplete range {start}-{end}: got {offset - start} bytes"
+        )
+
+
+def _split_ranges(total_size: int, num_segments: int) -> List[Tuple[int, int]]:
+    """
+    Split a file into contiguous byte ranges of (almost) equal size.
+
+    Args:
+        total_size: Size of the file (in bytes)
+        num_segments: Number of ranges
+
+    Returns:
+        List of (start, end) ranges, bounds included
+    """
+    segment_size = -(-total_size // num_segments)  # ceil division
+    return [
+        (start, min(start + segment_size, total_size) - 1)
+        for start in range(0, total_size, segment_size)
+    ]
+
+
+def _download_segmented(
+    session: requests.Session,
+    url: str,
+    part_path: Path,
+    state_path: Path,
+    total_size: int,
+    ranges: List[Tuple[int, int]],
+    chunk_size: int,
+    pbar: tqdm,
+    cancel: threading.Event,
+    validator: Optional[str] = None,
+    resume: bool = False,
+) -> None:
+    """
+    Download byte ranges of a file in parallel into its partial file.
+
+    If a range fails or the download is cancelled, the ranges left to
+    download are recorded in state_path (when the remote file has a
+    validator), so that the download can be resumed later.
+
+    Args:
+        session: HTTP session used to issue the requests
+        url: URL of the file to be downloaded
+        part_path: Partial file receiving the downloaded bytes
+        state_path: Resume state file of the download
+        total_size: Size of the remote file (in bytes)
+        ranges: List of (start, end) ranges to download
+        chunk_size: Size of chunks to download (in bytes)
+        pbar: Progress bar to update (may be disabled)
+        cancel: Event set to interrupt the download (KeyboardInterrupt is
+                raised once the ranges stopped)
+        validator: ETag/Last-Modified of the remote file
+        resume: Whether part_path already holds the bytes outside ranges
+    """
+    fd = _open_output(part_path, truncate=not resume)
+    try:
+        _preallocate(fd, total_size)
+
+        abort = threading.Event()
+        progress = {start: start for start, _ in ranges}
+        executor = ThreadPoolExecutor(max_workers=max(len(ranges), 1))
+        futures = [
+            executor.submit(
+                _download_range,
+                session,
+                url,
+                part_path,
+                start,
+                end,
+                chunk_size,
+                pbar,
+                abort,
+                cancel,
+                progress,
+                validator,
+            )
+            for start, end in ranges
+        ]
+        try:
+            for future in as_completed(futures):
+                future.result()
+            if cancel.is_set():
+                raise KeyboardInterrupt(f"Download of {url} cancelled")
+        except BaseException:
+            # Report the first failure right away: stop the other ranges
+            # instead of waiting for them to complete
+            abort.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            if validator:
+                remaining = [
+                    (progress[start], end)
+                    for start, end in ranges
+                    if progress[start] <= end
+                ]
+                os.fsync(fd)
+                _save_resume_state(state_path, total_size, validator, remaining)
+            raise
+        executor.shutdown()
+    finally:
+        _close_output(fd)
+
 
 def download_file(
-    url: str, local_path: str, chunk_size: int = 8192, show_progress: bool = True
+    url: str,
+    local_path: str,
+    chunk_size: int = 1 << 20,
+    show_progress: bool = True,
+    progress_every: int = 8,
+    progress_position: Optional[int] = None,
+    num_segments: int = 8,
+    resume: bool = False,
+    cancel: Optional[threading.Event] = None,
 ) -> bool:
     """
     Download file from a web URL and store it at the given local_path location.
 
+    When the server supports HTTP Range requests, the file is split into
+    num_segments byte ranges downloaded in parallel. Otherwise it falls back
+    to a single streamed request.
+
+    The file is downloaded into a "<local_path>.part" file, renamed to
+    local_path only once complete: local_path never holds a partial file.
+    With resume=True, a partial file left by an interrupted range download is
+    completed instead of being downloaded again, provided the remote file did
+    not change since (same size and ETag/Last-Modified).
+
     Args:
         url: URL of the file to be downloaded
         local_path: Path where the file will be stored
-        chunk_size: Size of chunks to download (in bytes)
+        chunk_size: Size of chunks to download (in bytes). Defaults to 1 MiB;
+                    larger values (e.g. 8-16 MiB) work well for cloud/S3-style
+                    endpoints on fast links
         show_progress: Whether to show download progress bar
+        progress_every: Number of chunks between two progress bar refreshes
+        progress_position: Line offset of the progress bar (used to stack
+                           bars when several files are downloaded at once)
+        num_segments: Number of byte ranges downloaded in parallel
+                      (1 disables range downloads)
+        resume: Whether to complete a partial download left by a previous call
+        cancel: Event set (e.g. from another thread) to interrupt the
+                download: KeyboardInterrupt is then raised after the current
+                chunk, once the resume state is saved
 
     Returns:
         Boolean indicating if the operation was successful
     """
+    if cancel is None:
+        cancel = threading.Event()
     local_path = Path(local_path)
     local_path.parent.mkdir(parents=True, exist_ok=True)
+    part_path = local_path.with_name(local_path.name + ".part")
+    state_path = local_path.with_name(local_path.name + ".part.json")
 
     try:
-        logger.debug(f"Starting download from {url}")
-        response = requests.get(url, stream=True, timeout=30)
-        response.raise_for_status()
+        logger.debug("Starting download from %s", url)
+
+        # HEAD first: errors (e.g. missing file) are reported before any
+        # transfer starts
+        total_size, accepts_ranges, validator = _get_remote_file_info(_SESSION, url)
+        logger.debug("File size: %.2f MB", total_size / (1024 * 1024))
 
-        total_size = int(response.headers.get("content-length", 0))
-        logger.debug(f"File size: {total_size / (1024 * 1024):.2f} MB")
-
-        with open(local_path, "wb") as file:
-            if show_progress and total_size > 0:
-                with tqdm(
-                    total=total_size, unit="B", unit_scale=True, desc=local_path.name
-                ) as pbar:
-                    for chunk in response.iter_content(chunk_size=chunk_size):
-                        if chunk:
-                            file.write(chunk)
-                            pbar.update(len(chunk))
+        can_use_ranges = accepts_ranges and total_size > 0 and hasattr(os, "pwrite")
+
+        ranges = None
+        if resume and can_use_ranges:
+            ranges = _load_resume_state(state_path, part_path, total_size, validator)
+        if ranges is not None:
+            remaining_size = sum(end - start + 1 for start, end in ranges)
+            logger.info(
+                f"Resuming {local_path.name} ({remaining_size:,} bytes left)"
+            )
+        else:
+            # Start from scratch: a stale resume state must not be reused
+            state_path.unlink(missing_ok=True)
+            remaining_size = total_size
+            if can_use_ranges and num_segments > 1:
+                if total_size >= num_segments * chunk_size:
+                    ranges = _split_ranges(total_size, num_segments)
+
+        with tqdm(
+            total=total_size or None,
+            initial=total_size - remaining_size,
+            unit="B",
+            unit_scale=True,
+            desc=local_path.name,
+            position=progress_position,
+            disable=not show_progress,
+        ) as pbar:
+            if ranges is not None:
+                logger.debug("Downloading in %d parallel ranges", len(ranges))
+                _download_segmented(
+                    _SESSION,
+                    url,
+                    part_path,
+                    state_path,
+                    total_size,
+                    ranges,
+                    chunk_size,
+                    pbar,
+                    cancel,
+                    validator=validator,
+                    resume=remaining_size < total_size,
+                )
             else:
-                for chunk in response.iter_content(chunk_size=chunk_size):
-                    if chunk:
-                        file.write(chunk)
+                _download_stream(
+                    _SESSION,
+                    url,
+                    part_path,
+                    chunk_size,
+                    pbar,
+                    progress_every,
+                    cancel,
+                )
+
+        os.replace(part_path, local_path)
+        state_path.unlink(missing_ok=True)
 
         logger.info(f"Successfully downloaded: {local_path}")
         return True
@@ -75,6 +690,7 @@ def download_insee_files(
     output_dir: Optional[str] = None,
     files_to_download: Optional[list] = None,
     force: bool = False,
+    max_workers: int = 4,
 ) -> dict:
     """
     Download INSEE SIRENE files based on configuration.
@@ -85,13 +701,18 @@ def download_insee_files(
         files_to_download: Optional list of specific files to download
                           (e.g., ['stock_etablissement', 'stock_unitelegale'])
                           If None, downloads all available files
-        force: If True, re-download files even if they already exist locally
+        force: If True, re-download files even if they already exist locally.
+               Otherwise, existing files are only skipped when their size
+               matches the remote one, and interrupted downloads (.part
+               files) are resumed
+        max_workers: Maximum number of files downloaded concurrently
+                     (lower it on slow links)
 
     Returns:
         Dictionary with download results. Values can be:
             - True: Successfully downloaded
             - False: Download failed
-            - 'skipped': File already exists and force=False
+            - 'skipped': File already exists (same size as remote) and force=False
     """
     from datetime import datetime
 
@@ -114,39 +735,82 @@ def download_insee_files(
     logger.info(f"Force re-download: {force}")
 
     # Filter URLs if specific files requested
-    urls_to_download = {}
-    for file_type, url in insee_urls.items():
-        if files_to_download is None or file_type in files_to_download:
-            urls_to_download[file_type] = url
+    wanted = None if files_to_download is None else frozenset(files_to_download)
+    urls_to_download = {
+        file_type: url
+        for file_type, url in insee_urls.items()
+        if wanted is None or file_type in wanted
+    }
 
     logger.info(f"Files to download: {list(urls_to_download.keys())}")
 
-    # Download each file
+    # Select files to download
     results = {}
+    pending_downloads = {}
     for file_type, url in urls_to_download.items():
         filename = url.split("/")[-1]
         local_path = output_dir / filename
 
-        # Check if file already exists
+        # Check if file already exists (and is complete when the remote size
+        # is known)
         if local_path.exists() and not force:
-            file_size = local_path.stat().st_size / (1024 * 1024)  # Size in MB
+            local_size = local_path.stat().st_size
+            try:
+                remote_size, _, _ = _get_remote_file_info(_SESSION, url)
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"Cannot check remote size of {filename}: {e}")
+                remote_size = 0
+            if remote_size in (0, local_size):
+                file_size = local_size / (1024 * 1024)  # Size in MB
+                logger.info(
+                    f"Skipping {file_type}: {filename} "
+                    f"(already exists, {file_size:.2f} MB)"
+                )
+                results[file_type] = "skipped"
+                continue
+
             logger.info(
-                f"Skipping {file_type}: {filename} (already exists, {file_size:.2f} MB)"
+                f"Updating {file_type}: {filename} (local size {local_size:,} "
+                f"differs from remote size {remote_size:,})"
             )
-            results[file_type] = "skipped"
-            continue
-
-        # Download file
-        if local_path.exists() and force:
+        elif local_path.exists() and force:
             logger.info(f"Force re-downloading {file_type}: {filename}")
         else:
             logger.info(f"Downloading {file_type}: {filename}")
 
-        logger.debug(f"URL: {url}")
-        logger.debug(f"Destination: {local_path}")
-
-        success = download_file(url, str(local_path))
-        results[file_type] = success
+        logger.debug("URL: %s", url)
+        logger.debug("Destination: %s", local_path)
+
+        pending_downloads[file_type] = (url, local_path)
+
+    # Download files concurrently (I/O-bound, one thread per file)
+    if pending_downloads:
+        workers = max(1, min(len(pending_downloads), max_workers))
+        cancel = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=workers)
+        futures = {
+            executor.submit(
+                download_file,
+                url,
+                str(local_path),
+                progress_position=position,
+                resume=not force,
+                cancel=cancel,
+            ): file_type
+            for position, (file_type, (url, local_path)) in enumerate(
+                pending_downloads.items()
+            )
+        }
+        try:
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        except BaseException:
+            # Ctrl-C (or an unexpected error): stop the running downloads,
+            # which save their resume state, instead of waiting for them
+            cancel.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
 
     # Summary with detailed statistics
     successful = sum(1 for v in results.values() if v is True)
@@ -0,0 +1,34 @@
+"""Functions to explore remote Parquet files without downloading them."""
+
+from typing import TYPE_CHECKING
+
+from utils.logger import setup_logger
+
+if TYPE_CHECKING:
+    import polars as pl
+
+# Setup logger for this module
+logger = setup_logger(__name__)
+
+
+def open_remote_parquet(url: str) -> "pl.LazyFrame":
+    """
+    Lazily scan a remote Parquet file over HTTP without downloading it.
+
+    Polars reads the file with HTTP Range requests: the footer first, then
+    only the row groups and columns a query needs, so an exploration query
+    such as open_remote_parquet(url).head(n).collect() fetches the footer and
+    the first row group (for the INSEE files, a few hundred KB to a few MB).
+    Queries that scan every row still fetch the whole file: full downloads
+    (download_file) remain the way to build silver tables.
+
+    Args:
+        url: HTTP(S) URL of the Parquet file (server must support HTTP Range)
+
+    Returns:
+        Polars LazyFrame reading the remote file
+    """
+    import polars as pl
+
+    logger.debug("Opening remote Parquet file: %s", url)
+    return pl.scan_parquet(url)
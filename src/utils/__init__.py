@@ -1,5 +1,15 @@
 """Utility modules."""
 
-from .config import get_data_paths, get_insee_urls, load_config
+from .config import (
+    get_data_paths,
+    get_insee_urls,
+    invalidate_config_cache,
+    load_config,
+)
 
-__all__ = ["load_config", "get_insee_urls", "get_data_paths"]
+__all__ = [
+    "load_config",
+    "invalidate_config_cache",
+    "get_insee_urls",
+    "get_data_paths",
+]
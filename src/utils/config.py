@@ -1,15 +1,37 @@
 """Configuration loader utility."""
 
+import os
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
+import orjson
 import yaml
 
+try:
+    # libyaml-based loader, much faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
+
+@lru_cache(maxsize=8)
 def load_config(config_path: str = "configs/config.yaml") -> Dict[str, Any]:
     """
     Load configuration from YAML file.
 
+    The parsed configuration is also written to a sibling JSON cache file
+    (e.g. configs/config.yaml.cache.json), which is loaded instead of the
+    YAML file as long as it is newer than it and readable. The cache is only
+    written when the configuration survives a JSON round trip unchanged
+    (string keys, no dates or other YAML-only types); otherwise the YAML
+    file is always read.
+
+    Results are cached per config_path: the returned dictionary is shared
+    between callers and must not be modified. Use invalidate_config_cache
+    to force a reload.
+
     Args:
         config_path: Path to the configuration file
 
@@ -21,12 +43,50 @@ def load_config(config_path: str = "configs/config.yaml") -> Dict[str, Any]:
     if not config_file.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
+    json_file = config_file.with_name(config_file.name + ".cache.json")
+    if (
+        json_file.exists()
+        and json_file.stat().st_mtime_ns >= config_file.stat().st_mtime_ns
+    ):
+        try:
+            return orjson.loads(json_file.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            # Unreadable cache: parse the YAML file and rewrite it
+            pass
+
     with open(config_file, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YamlLoader)
+
+    # Best effort: a read-only directory or a configuration JSON cannot
+    # represent exactly (dates, non-string keys...) only means no JSON cache
+    try:
+        payload = orjson.dumps(config)
+        if orjson.loads(payload) == config:
+            # Unique temporary file, so that concurrent writers never
+            # interleave their writes
+            with tempfile.NamedTemporaryFile(
+                dir=json_file.parent,
+                prefix=json_file.name + ".",
+                suffix=".tmp",
+                delete=False,
+            ) as tmp:
+                tmp.write(payload)
+            try:
+                os.replace(tmp.name, json_file)
+            except OSError:
+                os.unlink(tmp.name)
+                raise
+    except (OSError, orjson.JSONEncodeError):
+        pass
 
     return config
 
 
+def invalidate_config_cache() -> None:
+    """Clear cached configurations so that next load_config call re-reads them."""
+    load_config.cache_clear()
+
+
 def get_insee_urls(config: Dict[str, Any] = None) -> Dict[str, str]:
     """
     Extract INSEE download URLs from configuration.
@@ -2,10 +2,42 @@
 
 import logging
 import sys
-from datetime import datetime
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
+# File handler shared by all project loggers, attached once to the root logger
+_SHARED_FILE_HANDLER: Optional[logging.Handler] = None
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter rendering the timestamp once per second.
+
+    Records emitted within the same second reuse the formatted timestamp
+    instead of calling time.localtime and strftime again.
+    """
+
+    # Second-granularity timestamps (no ",mmm" suffix)
+    default_msec_format = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, formatted timestamp), replaced atomically
+        self._cached_time = (None, "")
+
+    def formatTime(
+        self, record: logging.LogRecord, datefmt: Optional[str] = None
+    ) -> str:
+        second = int(record.created)
+        cached_second, cached_text = self._cached_time
+        if second == cached_second:
+            return cached_text
+
+        text = super().formatTime(record, datefmt)
+        self._cached_time = (second, text)
+        return text
+
 
 def setup_logger(
     name: str,
@@ -18,10 +50,15 @@ def setup_logger(
     """
     Setup logger with file and console handlers.
 
+    Log records of all loggers are written to a single rotating file, through
+    a handler created on first call and attached to the root logger (named
+    loggers reach it by propagation). log_dir and log_file are therefore only
+    used by the first call requesting file output.
+
     Args:
         name: Logger name (usually __name__)
         log_dir: Directory where log files will be stored
-        log_file: Specific log file name (if None, uses timestamp)
+        log_file: Specific log file name (if None, uses app.log)
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         console_output: Whether to output logs to console
         file_output: Whether to output logs to file
@@ -37,7 +74,7 @@ def setup_logger(
         return logger
 
     # Create formatter
-    formatter = logging.Formatter(
+    formatter = _CachedTimeFormatter(
         fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
@@ -49,29 +86,45 @@ def setup_logger(
         console_handler.setFormatter(formatter)
         logger.addHandler(console_handler)
 
-    # File handler
-    if file_output:
-        if log_dir:
-            log_path = Path(log_dir)
-            log_path.mkdir(parents=True, exist_ok=True)
-
-            if log_file is None:
-                # Default: create timestamped log file
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                log_file = f"app_{timestamp}.log"
-
-            file_handler = logging.FileHandler(
-                log_path / log_file,
-                mode="a",  # append mode
-                encoding="utf-8",
-            )
-            file_handler.setLevel(level)
-            file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+    # File handler (shared)
+    if file_output and log_dir:
+        _attach_shared_file_handler(log_dir, log_file, formatter)
 
     return logger
 
 
+def _attach_shared_file_handler(
+    log_dir: str, log_file: Optional[str], formatter: logging.Formatter
+) -> None:
+    """
+    Create the shared rotating file handler and attach it to the root logger.
+
+    Does nothing if the handler already exists.
+
+    Args:
+        log_dir: Directory where log files will be stored
+        log_file: Specific log file name (if None, uses app.log)
+        formatter: Formatter used for the file records
+    """
+    global _SHARED_FILE_HANDLER
+
+    if _SHARED_FILE_HANDLER is not None:
+        return
+
+    log_path = Path(log_dir)
+    log_path.mkdir(parents=True, exist_ok=True)
+
+    _SHARED_FILE_HANDLER = RotatingFileHandler(
+        log_path / (log_file or "app.log"),
+        mode="a",  # append mode
+        maxBytes=10 << 20,  # 10 MB per file
+        backupCount=5,
+        encoding="utf-8",
+    )
+    _SHARED_FILE_HANDLER.setFormatter(formatter)
+    logging.getLogger().addHandler(_SHARED_FILE_HANDLER)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get or create a logger with default configuration.